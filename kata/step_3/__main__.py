@@ -1,7 +1,6 @@
 import pandas as pd
 from rich.console import Console
 import relationalai.semantics as rai
-import relationalai.semantics.std as std
 from kg.model import ARQModel, define_arq
 
 """
@@ -12,14 +11,20 @@ Step 3: Summer Solstice Observations by Location
 - Name the columns "species_count", "family_name", "country_code", "state_province"
 """
 def summer_solstice_query(arq: ARQModel) -> rai.Fragment:
-    dayofyear = std.datetime.datetime.dayofyear
-    delta_days = std.math.abs(dayofyear(arq.Solstice.datetime) - dayofyear(arq.Observation.event_datetime))
+    # Use the day-of-year already projected for each side (DAYOFYEAR is computed
+    # in dbt for observations, and in define_calendar for every CalendarEvent)
+    # instead of calling dayofyear per row in the query
+    solstice_day = arq.Solstice.day_of_year
+    observation_day = arq.Observation.day_of_year
 
     return rai.where(
+        arq.Solstice.summer(arq.Observation.hemisphere),
+        # Bounded range on the observation day rather than abs(delta) < 20,
+        # so the window filters observations before the taxonomy joins
+        observation_day > solstice_day - 20,
+        observation_day < solstice_day + 20,
         arq.Observation.classification(arq.Species),
         arq.Species.family(arq.Family),
-        arq.Solstice.summer(arq.Observation.hemisphere),
-        delta_days < 20,
         species_count := rai.count(arq.Species).per(
             arq.Family,
             arq.Observation.country_code,
@@ -33,9 +38,18 @@ def summer_solstice_query(arq: ARQModel) -> rai.Fragment:
     )
 
 
+# Explicit dtypes for both sides, so the string columns aren't compared as object arrays
+RESULT_DTYPES = {
+    "species_count": "int64",
+    "family_name": "string",
+    "country_code": "string",
+    "state_province": "string",
+}
+
+
 def test_solution(result: pd.DataFrame) -> None:
-    expected = pd.read_csv("kata/step_3/expected_results.csv")
-    result["species_count"] = result["species_count"].astype("int64")
+    expected = pd.read_csv("kata/step_3/expected_results.csv", dtype=RESULT_DTYPES)
+    result = result.astype(RESULT_DTYPES)
     pd.testing.assert_frame_equal(result, expected)
     console.print("✅ Query result is correct!")
     console.print("[dim]Congratulations! You've completed Step 3![/dim]\n")
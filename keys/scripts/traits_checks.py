@@ -6,12 +6,15 @@ This script validates trait_synonyms.json and checks for consistency
 between different sections of the file.
 """
 import argparse
+import io
 import json
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import AbstractSet, Any, Dict, Iterable, Iterator, List, Optional, Pattern, Set, Tuple
 
 
 HERE = Path(__file__).resolve().parent
@@ -32,12 +35,30 @@ TERMS_PATTERN = re.compile(
     re.IGNORECASE
 )
 
+# Case-sensitive variant matched against lowercased text, which avoids
+# per-character case folding in the regex engine
+TERMS_PATTERN_LOWER = re.compile(
+    "|".join(re.escape(term.lower()) for term in BOTANICAL_TERMS)
+)
+
+# Below this many files, process pool startup costs more than the scan itself
+PARALLEL_SCAN_MIN_FILES = 16
+
+
+@lru_cache(maxsize=4)
+def _parse_json(path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a JSON file; cached on (path, mtime) by load_json."""
+    return json.loads(path.read_bytes())
+
 
 def load_json(path: Path) -> Dict[str, Any]:
-    """Load and parse JSON file with better error handling."""
+    """Load and parse JSON file with better error handling.
+
+    Parsed documents are memoized per path and modification time, so the
+    checks run by `all` share a single parse of trait_synonyms.json.
+    """
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return _parse_json(path, path.stat().st_mtime_ns)
     except FileNotFoundError:
         print(f"ERROR: File not found: {path}", file=sys.stderr)
         sys.exit(1)
@@ -79,18 +100,36 @@ def get_defined_sources(data: Dict[str, Any]) -> Set[str]:
     return set(sources.keys())
 
 
+def format_path(segments: Tuple[Any, ...]) -> str:
+    """Render path segments (keys and list indices) as e.g. `a.b[0].c`."""
+    path = ""
+    for seg in segments:
+        if isinstance(seg, int):
+            path = f"{path}[{seg}]"
+        else:
+            path = f"{path}.{seg}" if path else seg
+    return path
+
+
 def iter_sources_in_definitions(node: Any, path: str = "") -> Iterable[Tuple[str, str]]:
-    """Recursively find all source references with their paths."""
-    if isinstance(node, dict):
-        if "source" in node and isinstance(node["source"], str):
-            yield (node["source"], path)
-        for key, value in node.items():
-            new_path = f"{path}.{key}" if path else key
-            yield from iter_sources_in_definitions(value, new_path)
-    elif isinstance(node, list):
-        for i, value in enumerate(node):
-            new_path = f"{path}[{i}]"
-            yield from iter_sources_in_definitions(value, new_path)
+    """Find all source references with their paths.
+
+    Walks the tree with an explicit stack, in the same order as a recursive
+    pre-order walk. Paths are kept as tuples of segments and only rendered to
+    strings for nodes that actually carry a source.
+    """
+    stack: List[Tuple[Any, Tuple[Any, ...]]] = [(node, (path,) if path else ())]
+    while stack:
+        node, segments = stack.pop()
+        if isinstance(node, dict):
+            if "source" in node and isinstance(node["source"], str):
+                yield (node["source"], format_path(segments))
+            # Push in reverse so children are visited in document order
+            for key, value in reversed(node.items()):
+                stack.append((value, segments + (key,)))
+        elif isinstance(node, list):
+            for i in range(len(node) - 1, -1, -1):
+                stack.append((node[i], segments + (i,)))
 
 
 def get_referenced_sources(data: Dict[str, Any]) -> Tuple[Set[str], Dict[str, List[str]]]:
@@ -117,11 +156,42 @@ def get_referenced_sources(data: Dict[str, Any]) -> Tuple[Set[str], Dict[str, Li
     return refs, locations
 
 
+def iter_source_ids(node: Any) -> Iterable[str]:
+    """Find all source references, without tracking where they occur."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if isinstance(node.get("source"), str):
+                yield node["source"]
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+
+
+def get_referenced_source_ids(data: Dict[str, Any]) -> Set[str]:
+    """Get all referenced sources; a cheaper get_referenced_sources without locations."""
+    sts = data.get("synonymToSource", {})
+    refs: Set[str] = set()
+    if isinstance(sts, dict):
+        refs.update(
+            sid
+            for source_list in sts.values() if isinstance(source_list, list)
+            for sid in source_list if isinstance(sid, str)
+        )
+    refs.update(iter_source_ids(data.get("synonymDefinitions", {})))
+    return refs
+
+
 def check_sources(verbose: bool = False) -> int:
     """Check source ID consistency with optional verbose output."""
     data = load_json(TRAITS_FILE)
     defined = get_defined_sources(data)
-    referenced, locations = get_referenced_sources(data)
+    # Locations are only reported in verbose mode, so skip building them otherwise
+    if verbose:
+        referenced, locations = get_referenced_sources(data)
+    else:
+        referenced, locations = get_referenced_source_ids(data), {}
 
     undef = sorted(referenced - defined)
     unused = sorted(defined - referenced)
@@ -150,10 +220,14 @@ def check_sources(verbose: bool = False) -> int:
     return 0 if not undef else 2
 
 
-def get_synonyms_from_sources(data: Dict[str, Any]) -> Set[str]:
-    """Extract synonym keys from synonymToSource section."""
+def get_synonyms_from_sources(data: Dict[str, Any]) -> AbstractSet[str]:
+    """Extract synonym keys from synonymToSource section.
+
+    Returns the section's keys view rather than a copy; set operations work
+    on it directly.
+    """
     sts = data.get("synonymToSource", {})
-    return set(sts.keys()) if isinstance(sts, dict) else set()
+    return sts.keys() if isinstance(sts, dict) else set()
 
 
 def get_synonyms_from_defs(data: Dict[str, Any]) -> Set[str]:
@@ -167,10 +241,7 @@ def get_synonyms_from_defs(data: Dict[str, Any]) -> Set[str]:
         if top_k == "_metadata":
             continue
         if isinstance(top_v, dict):
-            for k in top_v.keys():
-                if k == "traitId":
-                    continue
-                keys.add(k)
+            keys.update(k for k in top_v if k != "traitId")
     return keys
 
 
@@ -202,63 +273,143 @@ def check_coverage() -> int:
     return 0 if not missing_in_defs and not missing_in_sources else 3
 
 
+def iter_line_matches(text: str, pattern: Pattern[str]) -> Iterator[Tuple[int, str, List[Tuple[int, int]]]]:
+    """Match pattern line by line, yielding (line number, line, spans) for hits."""
+    for i, line in enumerate(io.StringIO(text), 1):
+        spans = [m.span() for m in pattern.finditer(line)]
+        if spans:
+            yield (i, line, spans)
+
+
+def iter_text_matches(
+    text: str, pattern: Pattern[str], search_text: Optional[str] = None
+) -> Iterator[Tuple[int, str, List[Tuple[int, int]]]]:
+    """Match pattern over the whole text in one pass.
+
+    Yields the same (line number, line, line-relative spans) tuples as
+    iter_line_matches. Line numbers are recovered by counting newlines between
+    consecutive matches (str.count runs in C), so lines without matches cost
+    no Python-level work. If given, the pattern runs over search_text instead,
+    an equal-length copy of text (e.g. lowercased).
+    """
+    line_no = 1
+    counted_to = 0      # Newlines before this offset are included in line_no
+    line_start = 0
+    line_end = -1       # Offset of the current line's newline (or end of text)
+    spans: List[Tuple[int, int]] = []
+    for m in pattern.finditer(text if search_text is None else search_text):
+        start, end = m.span()
+        if start > line_end:
+            if spans:
+                yield (line_no, text[line_start:line_end], spans)
+            line_no += text.count("\n", counted_to, start)
+            counted_to = start
+            line_start = text.rfind("\n", 0, start) + 1
+            line_end = text.find("\n", start)
+            if line_end == -1:
+                line_end = len(text)
+            spans = []
+        spans.append((start - line_start, end - line_start))
+    if spans:
+        yield (line_no, text[line_start:line_end], spans)
+
+
+def scan_file(fp: Path, pattern: Optional[str] = None) -> Tuple[List[Tuple[int, str, int]], Optional[str]]:
+    """Scan one file for the built-in terms, or a custom regex pattern.
+
+    Returns the highlighted (line number, line, match count) hits and the read
+    error, if any. Takes the pattern source rather than a compiled pattern so
+    it can be shipped to worker processes.
+    """
+    try:
+        text = fp.read_text(encoding="utf-8", errors="replace")
+    except Exception as e:
+        return [], str(e)
+
+    if pattern:
+        # Custom patterns keep per-line semantics (^, $, \s)
+        line_matches = iter_line_matches(text, re.compile(pattern, re.IGNORECASE))
+    else:
+        # The built-in terms never span lines, so they can be matched over the
+        # whole file at once, against a lowercased copy of it
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            line_matches = iter_text_matches(text, TERMS_PATTERN_LOWER, lowered)
+        else:
+            # A few characters lowercase to several, which would shift offsets
+            line_matches = iter_text_matches(text, TERMS_PATTERN)
+
+    hits = []
+    for i, line, spans in line_matches:
+        # Highlight matches in output, joining slices in one pass
+        stripped = line.rstrip()
+        parts = []
+        prev = 0
+        for start, end in spans:
+            parts.append(stripped[prev:start])
+            parts.append(f"**{line[start:end]}**")
+            prev = end
+        parts.append(stripped[prev:])
+        hits.append((i, "".join(parts), len(spans)))
+    return hits, None
+
+
 def scan_usage(pattern: Optional[str] = None, include_hidden: bool = False) -> int:
     """Scan for botanical terms with configurable pattern and file filtering."""
-    search_pattern = TERMS_PATTERN
     if pattern:
         try:
-            search_pattern = re.compile(pattern, re.IGNORECASE)
+            re.compile(pattern, re.IGNORECASE)
         except re.error as e:
             print(f"ERROR: Invalid regex pattern '{pattern}': {e}", file=sys.stderr)
             return 1
 
     files = []
-    for name in os.listdir(ROOT):
-        # Skip hidden files unless requested
-        if not include_hidden and name.startswith('.'):
-            continue
-        if name.endswith((".json", ".txt", ".md")):
-            files.append(ROOT / name)
+    with os.scandir(ROOT) as entries:
+        for entry in entries:
+            # Skip hidden files unless requested
+            if not include_hidden and entry.name.startswith('.'):
+                continue
+            if entry.name.endswith((".json", ".txt", ".md")) and entry.is_file():
+                files.append(ROOT / entry.name)
+    files.sort()
 
     print("=== Usage Scan ===")
     found_any = False
     match_count = 0
-    
-    for fp in sorted(files):
-        file_matches = 0
-        try:
-            with fp.open("r", encoding="utf-8", errors="replace") as f:
-                for i, line in enumerate(f, 1):
-                    matches = list(search_pattern.finditer(line))
-                    if matches:
-                        # Highlight matches in output
-                        display_line = line.rstrip()
-                        for match in reversed(matches):  # Reverse to preserve positions
-                            term = match.group()
-                            start, end = match.span()
-                            display_line = (
-                                display_line[:start] +
-                                f"**{term}**" +
-                                display_line[end:]
-                            )
-                        print(f"{fp.name}:{i}: {display_line}")
-                        file_matches += len(matches)
-                        found_any = True
-        except Exception as e:
-            print(f"WARN: could not read {fp}: {e}", file=sys.stderr)
+
+    scan = partial(scan_file, pattern=pattern)
+    if len(files) >= PARALLEL_SCAN_MIN_FILES:
+        with ProcessPoolExecutor() as ex:
+            results = list(ex.map(scan, files, chunksize=4))
+    else:
+        results = [scan(fp) for fp in files]
+
+    # Report in sorted file order regardless of which worker finished first
+    for fp, (hits, error) in zip(files, results):
+        if error is not None:
+            print(f"WARN: could not read {fp}: {error}", file=sys.stderr)
             continue
-        
-        if file_matches > 0:
-            match_count += file_matches
+        for i, display_line, n in hits:
+            print(f"{fp.name}:{i}: {display_line}")
+            match_count += n
+            found_any = True
     
     if found_any:
-        print(f"\nFound {match_count} term occurrences across {len([f for f in files if f.exists()])} files")
+        print(f"\nFound {match_count} term occurrences across {len(files)} files")
     else:
         print("No matching terms found")
 
     return 0
 
 
+# Checks run by `all` once JSON validation passes, each called with its defaults
+CHECKS = (
+    ("Source Check", check_sources),
+    ("Coverage Check", check_coverage),
+    ("Usage Scan", scan_usage),
+)
+
+
 def main(argv: Iterable[str]) -> int:
     """Main entry point with improved argument parsing."""
     p = argparse.ArgumentParser(
@@ -294,7 +445,7 @@ Examples:
     # all subcommand
     sub.add_parser("all", help="Run all checks")
 
-    args = p.parse_args(list(argv))
+    args = p.parse_args(argv if isinstance(argv, list) else list(argv))
 
     if args.cmd == "validate-json":
         return validate_json(args.file)
@@ -306,15 +457,21 @@ Examples:
         return scan_usage(args.pattern, args.include_hidden)
     elif args.cmd == "all":
         print("Running all trait synonym checks...\n")
-        rc = 0
-        checks = [
-            ("JSON Validation", lambda: validate_json()),
-            ("Source Check", lambda: check_sources()),
-            ("Coverage Check", lambda: check_coverage()),
-            ("Usage Scan", lambda: scan_usage())
-        ]
-        
-        for name, check_fn in checks:
+        print("--- JSON Validation ---")
+        rc = validate_json()
+        print()
+        # The remaining checks work off the same parsed file (shared through
+        # load_json's cache), so there is nothing meaningful to report once
+        # it fails to parse. A structure warning is not fatal: the checks
+        # treat missing sections as empty, and its rc is folded in below
+        if rc != 0:
+            try:
+                load_json(TRAITS_FILE)
+            except json.JSONDecodeError:
+                print("✗ JSON validation failed - skipping remaining checks")
+                return rc
+
+        for name, check_fn in CHECKS:
             print(f"--- {name} ---")
             code = check_fn()
             rc = rc or code
@@ -13,6 +13,7 @@ Run queries using `uv run -m kg.apps.observation_eda <function> <args>` eg
 import argparse
 import inspect
 import sys
+from functools import cache
 from typing import Callable, Dict
 
 import relationalai.semantics as rai
@@ -102,12 +103,14 @@ def species_before_summer_solstice_by_class(arq: ARQModel, year: int = 2025) ->
 
 ## ↓ brought to you by Claude
 
+@cache
 def _get_query_functions() -> Dict[str, Callable]:
     """Get all query functions defined in this module.
 
     Returns a dictionary mapping function names to function objects.
     Only includes functions that take ARQModel as first parameter and
-    return rai.Fragment.
+    return rai.Fragment. The module's functions don't change after import,
+    so the introspection result is cached.
     """
     current_module = sys.modules[__name__]
     query_functions = {}
@@ -1,7 +1,6 @@
 from typing import Protocol
 
 import relationalai.semantics as rai
-from relationalai.semantics.snowflake import Table
 
 from kg.model.core.calendar import define_calendar
 from kg.model.core.geography import define_geography
@@ -22,6 +21,7 @@ class Taxon(Protocol):
     canonical_name: rai.Relationship
     rank: rai.Relationship
     parent: rai.Relationship
+    ancestor: rai.Relationship
     genus: rai.Relationship
     family: rai.Relationship
     order: rai.Relationship
@@ -163,8 +163,13 @@ def define_arq(m: rai.Model, db: str = "TEAM_ARQ", schema: str = "PUBLIC") -> AR
     Returns:
         The typed ARQ model
     """
+    # Imported here so that importing kg.model (e.g. for the protocols) doesn't
+    # load the Snowflake integration
+    from relationalai.semantics.snowflake import Table
+
     # Define source table binding helper
-    source = lambda t: Table(f"{db}.{schema}.{t}")
+    prefix = f"{db}.{schema}."
+    source = lambda t: Table(prefix + t)
 
     # Define foundational concepts first (used by other modules)
     define_calendar(m)
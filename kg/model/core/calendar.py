@@ -1,5 +1,4 @@
 import relationalai.semantics as rai
-import relationalai.semantics.std as std
 
 # Core temporal concepts used across multiple models
 
@@ -10,6 +9,9 @@ def define_calendar(m: rai.Model):
     These concepts are used by observations, astronomical events, and other
     time-based entities in the knowledge graph.
     """
+    # Imported here so that importing kg.model doesn't load the std library
+    import relationalai.semantics.std as std
+
     m.Year = m.Concept("Year", extends=[rai.Integer])
     m.DayOfYear = m.Concept("DayOfYear", extends=[rai.Integer])
 
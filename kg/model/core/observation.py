@@ -1,10 +1,14 @@
+from typing import TYPE_CHECKING
+
 import relationalai.semantics as rai
-from relationalai.semantics.snowflake import Table
+
+if TYPE_CHECKING:
+    from relationalai.semantics.snowflake import Table
 
 # Sourced from dbt/models/staging/observation.sql
 
 
-def define_observation(m: rai.Model, source: Table):
+def define_observation(m: rai.Model, source: "Table"):
     """Define the Observation concept representing GBIF plant observation records.
 
     An Observation represents a documented occurrence of a plant species at a specific
@@ -45,19 +49,26 @@ def define_observation(m: rai.Model, source: Table):
     # Bind source data to concepts
     rai.define(m.Observation.new(id=source.GBIFID))
     obs = rai.where(m.Observation.id == source.GBIFID)
-    obs.define(m.Observation.event_datetime(source.EVENTDATE))
-    obs.define(m.Observation.day_of_year(source.DAYOFYEAR))
-    obs.define(m.Observation.year(source.YEAR))
+    # Columns derived from the same inputs are null together, so they share a
+    # define; independently nullable columns keep their own, since a missing
+    # value fails every binding in the same statement
+    obs.define(
+        m.Observation.event_datetime(source.EVENTDATE),
+        m.Observation.day_of_year(source.DAYOFYEAR),
+        m.Observation.year(source.YEAR),
+    )
     obs.define(m.Observation.basis_of_record(source.BASISOFRECORD))
     obs.define(m.Observation.country_code(source.COUNTRYCODE))
     obs.define(m.Observation.state_province(source.STATEPROVINCE))
     obs.define(m.Observation.latitude(source.LAT))
     obs.define(m.Observation.longitude(source.LON))
-    obs.define(m.Observation.h3_cell_6(source.H3_CELL_6))
-    obs.define(m.Observation.h3_cell_7(source.H3_CELL_7))
-    obs.define(m.Observation.h3_cell_8(source.H3_CELL_8))
-    obs.define(m.Observation.h3_cell_9(source.H3_CELL_9))
-    obs.define(m.Observation.h3_cell_10(source.H3_CELL_10))
+    obs.define(
+        m.Observation.h3_cell_6(source.H3_CELL_6),
+        m.Observation.h3_cell_7(source.H3_CELL_7),
+        m.Observation.h3_cell_8(source.H3_CELL_8),
+        m.Observation.h3_cell_9(source.H3_CELL_9),
+        m.Observation.h3_cell_10(source.H3_CELL_10),
+    )
     obs.define(
         m.Observation.classification(m.Taxon.filter_by(id=source.TAXONKEY))
     )
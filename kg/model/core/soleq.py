@@ -1,10 +1,14 @@
+from typing import TYPE_CHECKING
+
 import relationalai.semantics as rai
-from relationalai.semantics.snowflake import Table
+
+if TYPE_CHECKING:
+    from relationalai.semantics.snowflake import Table
 
 # Sourced from dbt/models/staging/soleq.sql
 
 
-def define_solstice_equinox(m: rai.Model, source: Table):
+def define_solstice_equinox(m: rai.Model, source: "Table"):
     """Define solstice and equinox concepts for astronomical calendar events.
 
     Source: https://www.astropixels.com/ephemeris/soleq2001.html
@@ -37,21 +41,25 @@ def define_solstice_equinox(m: rai.Model, source: Table):
     m.Solstice = m.Concept("Solstice", extends=[m.CalendarEvent])
     m.Solstice.summer = m.Property("{Solstice} is in the summer for {Hemisphere}")
     m.Solstice.winter = m.Property("{Solstice} is in the winter for {Hemisphere}")
-    def_solstice = lambda col, summer, winter: rai.define(
-        s := m.Solstice.new(datetime=col),
-        s.summer(summer),
-        s.winter(winter),
+    # Both solstices of a year come from the same seed row, so define them
+    # together in one statement
+    rai.define(
+        june := m.Solstice.new(datetime=source.summer_solstice),
+        june.summer(m.HemisphereNorth),
+        june.winter(m.HemisphereSouth),
+        december := m.Solstice.new(datetime=source.winter_solstice),
+        december.summer(m.HemisphereSouth),
+        december.winter(m.HemisphereNorth),
     )
-    def_solstice(source.summer_solstice, m.HemisphereNorth, m.HemisphereSouth)
-    def_solstice(source.winter_solstice, m.HemisphereSouth, m.HemisphereNorth)
 
     m.Equinox = m.Concept("Equinox", extends=[m.CalendarEvent])
     m.Equinox.spring = m.Property("{Equinox} is in the spring for {Hemisphere}")
     m.Equinox.fall = m.Property("{Equinox} is in the fall for {Hemisphere}")
-    def_equinox = lambda col, spring, fall: rai.define(
-        e := m.Equinox.new(datetime=col),
-        e.spring(spring),
-        e.fall(fall),
+    rai.define(
+        march := m.Equinox.new(datetime=source.spring_equinox),
+        march.spring(m.HemisphereNorth),
+        march.fall(m.HemisphereSouth),
+        september := m.Equinox.new(datetime=source.fall_equinox),
+        september.spring(m.HemisphereSouth),
+        september.fall(m.HemisphereNorth),
     )
-    def_equinox(source.spring_equinox, m.HemisphereNorth, m.HemisphereSouth)
-    def_equinox(source.fall_equinox, m.HemisphereSouth, m.HemisphereNorth)
@@ -1,9 +1,13 @@
+from typing import TYPE_CHECKING
+
 import relationalai.semantics as rai
-from relationalai.semantics.snowflake import Table
+
+if TYPE_CHECKING:
+    from relationalai.semantics.snowflake import Table
 
 # Sourced from dbt/models/staging/taxon.sql
 
-def define_taxon(m: rai.Model, source: Table):
+def define_taxon(m: rai.Model, source: "Table"):
     """Define the Taxon concept representing elements of the GBIF taxonomy.
 
     A Taxon represents a taxonomic unit (species, genus, family, etc.) in the
@@ -38,31 +42,33 @@ def define_taxon(m: rai.Model, source: Table):
     rai.define(
         t1.parent(t2)
     ).where(
-        t1 != t2,
+        # Drop self-parented rows on the source ids, before the Taxon lookups
+        source.TAXONID != source.PARENTNAMEUSAGEID,
         t1.id == source.TAXONID,
         t2.id == source.PARENTNAMEUSAGEID,
     )
 
-    # Define taxonomic rank concepts
+    # Define taxonomic rank concepts from the bound Taxon.rank, so the source
+    # table's rank column is read once rather than once per rank concept
     m.Species = m.Concept("Species", extends=[m.Taxon])
-    rai.define(m.Species.new(id=source.TAXONID)).where(source.TAXONRANK == "species")
+    rai.where(m.Taxon.rank == "species").define(m.Species.new(id=m.Taxon.id))
 
     m.Genus = m.Concept("Genus", extends=[m.Taxon])
-    rai.define(m.Genus.new(id=source.TAXONID)).where(source.TAXONRANK == "genus")
+    rai.where(m.Taxon.rank == "genus").define(m.Genus.new(id=m.Taxon.id))
 
     m.Family = m.Concept("Family", extends=[m.Taxon])
-    rai.define(m.Family.new(id=source.TAXONID)).where(source.TAXONRANK == "family")
+    rai.where(m.Taxon.rank == "family").define(m.Family.new(id=m.Taxon.id))
 
     m.Order = m.Concept("Order", extends=[m.Taxon])
-    rai.define(m.Order.new(id=source.TAXONID)).where(source.TAXONRANK == "order")
+    rai.where(m.Taxon.rank == "order").define(m.Order.new(id=m.Taxon.id))
 
     m.Class = m.Concept("Class", extends=[m.Taxon])
-    rai.define(m.Class.new(id=source.TAXONID)).where(source.TAXONRANK == "class")
+    rai.where(m.Taxon.rank == "class").define(m.Class.new(id=m.Taxon.id))
 
     m.Phylum = m.Concept("Phylum", extends=[m.Taxon])
-    rai.define(m.Phylum.new(id=source.TAXONID)).where(source.TAXONRANK == "phylum")
+    rai.where(m.Taxon.rank == "phylum").define(m.Phylum.new(id=m.Taxon.id))
 
     m.Kingdom = m.Concept("Kingdom", extends=[m.Taxon])
-    rai.define(m.Kingdom.new(id=source.TAXONID)).where(source.TAXONRANK == "kingdom")
+    rai.where(m.Taxon.rank == "kingdom").define(m.Kingdom.new(id=m.Taxon.id))
 
 
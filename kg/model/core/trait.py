@@ -1,5 +1,9 @@
+from typing import TYPE_CHECKING
+
 import relationalai.semantics as rai
-from relationalai.semantics.snowflake import Table
+
+if TYPE_CHECKING:
+    from relationalai.semantics.snowflake import Table
 
 '''
 Sources
@@ -8,7 +12,7 @@ List others here, or even better we can insert this
 directly into the model
 '''
 
-def define_traits(m: rai.Model, source: Table):
+def define_traits(m: rai.Model, source: "Table"):
     '''
     Traits 
     '''
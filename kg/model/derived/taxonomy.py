@@ -1,5 +1,4 @@
 import relationalai.semantics as rai
-from relationalai.semantics.snowflake import Table
 
 
 def define_taxonomy(m: rai.Model):
@@ -8,9 +7,30 @@ def define_taxonomy(m: rai.Model):
     parent-child relationships in the source data.
     """
 
+    # Reflexive-transitive closure of the parent edge along the major ranks:
+    # every taxon is its own ancestor, and a parent step only counts when it
+    # goes up exactly one rank. Infraspecific taxa and chains that skip a rank
+    # (e.g. a genus parented straight to an order) get no rank relationships,
+    # as with the hand-unrolled chains, and each rank relationship below is a
+    # single join against it. The recursive rule is evaluated to a fixed point
+    m.Taxon.ancestor = m.Relationship("{Taxon} has ancestor {Taxon}")
+    t = m.Taxon.ref()
+    a = m.Taxon.ref()
+    rai.define(t.ancestor(t))
+    for child_rank, parent_rank in [
+        (m.Species, m.Genus),
+        (m.Genus, m.Family),
+        (m.Family, m.Order),
+        (m.Order, m.Class),
+        (m.Class, m.Phylum),
+        (m.Phylum, m.Kingdom),
+    ]:
+        child = child_rank.ref()
+        parent = parent_rank.ref()
+        rai.define(child.ancestor(a)).where(child.parent(parent), parent.ancestor(a))
+
     # Define hierarchical relationships
     # References for each taxonomic rank
-    s = m.Species.ref()
     g = m.Genus.ref()
     f = m.Family.ref()
     o = m.Order.ref()
@@ -20,165 +40,24 @@ def define_taxonomy(m: rai.Model):
 
     # Genus relationships
     m.Taxon.genus = m.Property("{Taxon} comprises {Genus}")
-    rai.define(
-        s.genus(g)
-    ).where(
-        s.parent(g)
-    )
-    rai.define(g.genus(g))
-
+    rai.define(t.genus(g)).where(t.ancestor(g))
 
     # Family relationships
     m.Taxon.family = m.Property("{Taxon} comprises {Family}")
-    rai.define(
-        s.family(f)
-    ).where(
-        s.parent(g),
-        g.parent(f)
-    )
-    rai.define(
-        g.family(f)
-    ).where(
-        g.parent(f),
-    )
-    rai.define(f.family(f))
+    rai.define(t.family(f)).where(t.ancestor(f))
 
     # Order relationships
     m.Taxon.order = m.Property("{Taxon} comprises {Order}")
-    rai.define(
-        s.order(o)
-    ).where(
-        s.parent(g),
-        g.parent(f),
-        f.parent(o)
-    )
-    rai.define(
-        g.order(o)
-    ).where(
-        g.parent(f),
-        f.parent(o)
-    )
-    rai.define(
-        f.order(o)
-    ).where(
-        f.parent(o),
-    )
-    rai.define(o.order(o))
+    rai.define(t.order(o)).where(t.ancestor(o))
 
     # Class relationships
     m.Taxon.class_ = m.Property("{Taxon} comprises {Class}")
-    rai.define(
-        s.class_(c)
-    ).where(
-        s.parent(g),
-        g.parent(f),
-        f.parent(o),
-        o.parent(c)
-    )
-    rai.define(
-        g.class_(c)
-    ).where(
-        g.parent(f),
-        f.parent(o),
-        o.parent(c)
-    )
-    rai.define(
-        f.class_(c)
-    ).where(
-        f.parent(o),
-        o.parent(c)
-    )
-    rai.define(
-        o.class_(c)
-    ).where(
-        o.parent(c),
-    )
-    rai.define(c.class_(c))
+    rai.define(t.class_(c)).where(t.ancestor(c))
 
     # Phylum relationships
     m.Taxon.phylum = m.Property("{Taxon} comprises {Phylum}")
-    rai.define(
-        s.phylum(p)
-    ).where(
-        s.parent(g),
-        g.parent(f),
-        f.parent(o),
-        o.parent(c),
-        c.parent(p)
-    )
-    rai.define(
-        g.phylum(p)
-    ).where(
-        g.parent(f),
-        f.parent(o),
-        o.parent(c),
-        c.parent(p)
-    )
-    rai.define(
-        f.phylum(p)
-    ).where(
-        f.parent(o),
-        o.parent(c),
-        c.parent(p)
-    )
-    rai.define(
-        o.phylum(p)
-    ).where(
-        o.parent(c),
-        c.parent(p)
-    )
-    rai.define(
-        c.phylum(p)
-    ).where(
-        c.parent(p),
-    )
-    rai.define(p.phylum(p))
+    rai.define(t.phylum(p)).where(t.ancestor(p))
 
     # Kingdom relationships
     m.Taxon.kingdom = m.Property("{Taxon} comprises {Kingdom}")
-    rai.define(
-        s.kingdom(k)
-    ).where(
-        s.parent(g),
-        g.parent(f),
-        f.parent(o),
-        o.parent(c),
-        c.parent(p),
-        p.parent(k)
-    )
-    rai.define(
-        g.kingdom(k)
-    ).where(
-        g.parent(f),
-        f.parent(o),
-        o.parent(c),
-        c.parent(p),
-        p.parent(k)
-    )
-    rai.define(
-        f.kingdom(k)
-    ).where(
-        f.parent(o),
-        o.parent(c),
-        c.parent(p),
-        p.parent(k)
-    )
-    rai.define(
-        o.kingdom(k)
-    ).where(
-        o.parent(c),
-        c.parent(p),
-        p.parent(k)
-    )
-    rai.define(
-        c.kingdom(k)
-    ).where(
-        c.parent(p),
-        p.parent(k)
-    )
-    rai.define(
-        p.kingdom(k)
-    ).where(
-        p.parent(k),
-    )
-    rai.define(k.kingdom(k))
+    rai.define(t.kingdom(k)).where(t.ancestor(k))
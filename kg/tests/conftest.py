@@ -29,9 +29,9 @@ def _maybe_set_snowflake_password_from_pat_file() -> None:
         os.environ["password"] = token
 
 
-_maybe_set_snowflake_password_from_pat_file()
-
-
 @pytest.fixture(scope="session")
 def arq() -> ARQModel:
+    # Resolved here rather than at import so collection doesn't touch the
+    # filesystem; the session scope already makes this a one-time call
+    _maybe_set_snowflake_password_from_pat_file()
     return define_arq(sem.Model(f"arq_test"))
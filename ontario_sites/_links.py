@@ -0,0 +1,45 @@
+"""
+Link extraction shared by the Phase 1 validation scripts.
+"""
+
+from functools import lru_cache
+from html.parser import HTMLParser
+from urllib.parse import urlparse
+
+
+class LinkExtractor(HTMLParser):
+    """Extract href and src attributes from HTML, in document order."""
+    
+    def __init__(self):
+        super().__init__()
+        self.links = []
+        
+    def handle_starttag(self, tag, attrs):
+        attrs_dict = dict(attrs)
+        if 'href' in attrs_dict:
+            self.links.append(('href', attrs_dict['href']))
+        if 'src' in attrs_dict:
+            self.links.append(('src', attrs_dict['src']))
+
+
+def extract_links(content):
+    """
+    Extract (attribute, value) pairs for href and src attributes of one page.
+    
+    The page is fed to HTMLParser but not closed, as the scripts always did.
+    """
+    parser = LinkExtractor()
+    parser.feed(content)
+    return parser.links
+
+
+@lru_cache(maxsize=8192)
+def link_netloc(url):
+    """Network location of url; the same URLs recur on every page of a site."""
+    return urlparse(url).netloc
+
+
+@lru_cache(maxsize=None)
+def same_domain_hosts(base_domain):
+    """Netlocs that count as base_domain: the bare domain and its www. variant."""
+    return frozenset((base_domain, 'www.' + base_domain))
@@ -0,0 +1,24 @@
+"""
+Per-file work map shared by the ontario_sites scripts.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Below this many files, process pool startup costs more than the per-file work
+PARALLEL_MIN_FILES = 16
+
+
+def map_files(fn, paths, chunksize=16):
+    """
+    Apply fn to every path, in worker processes once there are enough of them.
+    
+    fn must be picklable (a module-level function or a partial of one).
+    
+    Returns:
+        List of results in paths order
+    """
+    if len(paths) >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor() as ex:
+            return list(ex.map(fn, paths, chunksize=chunksize))
+    return [fn(path) for path in paths]
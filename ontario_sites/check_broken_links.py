@@ -8,23 +8,21 @@ import os
 import re
 from pathlib import Path
 from urllib.parse import urlparse, unquote
-from html.parser import HTMLParser
-from collections import defaultdict
+from collections import Counter, defaultdict
+from functools import lru_cache, partial
 
+from _links import extract_links
+from _parallel import map_files
 
-class LinkExtractor(HTMLParser):
-    """Extract href attributes from HTML."""
-    
-    def __init__(self):
-        super().__init__()
-        self.href_links = []
-        
-    def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
-        if 'href' in attrs_dict:
-            self.href_links.append(attrs_dict['href'])
 
+def extract_hrefs(content):
+    """Extract href attribute values from HTML."""
+    return [value for attr, value in extract_links(content) if attr == 'href']
 
+
+# Navigation links repeat across nearly every page, so both link helpers are
+# memoized on (link, base_domain)
+@lru_cache(maxsize=None)
 def is_internal_link(link, base_domain):
     """Check if link is internal (same domain)."""
     link = link.strip()
@@ -45,6 +43,7 @@ def is_internal_link(link, base_domain):
     return False
 
 
+@lru_cache(maxsize=None)
 def extract_file_path(link, base_domain):
     """
     Extract local file path from a link.
@@ -84,6 +83,28 @@ def extract_file_path(link, base_domain):
     return base_name
 
 
+def extract_internal_links(html_file, site_name):
+    """
+    Extract the internal links of one HTML file.
+    
+    Returns:
+        Tuple of ([link_path], error or None)
+    """
+    try:
+        with open(html_file, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+        
+        links = [
+            extract_file_path(link, site_name)
+            for link in extract_hrefs(content)
+            if is_internal_link(link, site_name)
+        ]
+        return links, None
+    
+    except Exception as e:
+        return [], str(e)
+
+
 def check_broken_links(site_path, site_name, sample_size=50):
     """
     Check for broken internal links in HTML files.
@@ -103,30 +124,23 @@ def check_broken_links(site_path, site_name, sample_size=50):
     print(f"{'='*60}")
     print(f"Analyzing {len(html_files)} HTML files")
     
-    # Track all internal links and their sources
-    internal_links = defaultdict(list)  # link -> [source_files]
+    # Track all internal links and how many times they are referenced
+    internal_links = Counter()          # link -> reference count
     missing_files = defaultdict(int)    # missing_file -> count
     
-    for html_file in html_files:
-        try:
-            with open(html_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            parser = LinkExtractor()
-            parser.feed(content)
-            
-            for link in parser.href_links:
-                if is_internal_link(link, site_name):
-                    rel_path = extract_file_path(link, site_name)
-                    internal_links[rel_path].append(str(html_file.relative_to(site_path)))
-                    
-        except Exception as e:
-            print(f"Error processing {html_file}: {e}")
+    # Parse files in worker processes; results come back in html_files order
+    results = map_files(partial(extract_internal_links, site_name=site_name), html_files)
+    
+    for html_file, (links, error) in zip(html_files, results):
+        if error is not None:
+            print(f"Error processing {html_file}: {error}")
+            continue
+        internal_links.update(links)
     
     # Check which files are missing
     print(f"\nTotal internal links found: {len(internal_links)}")
     
-    for link_path, sources in internal_links.items():
+    for link_path, references in internal_links.items():
         # Normalize the path - remove any leading slashes
         normalized = link_path.lstrip('/').lstrip('./')
         
@@ -151,7 +165,7 @@ def check_broken_links(site_path, site_name, sample_size=50):
         exists = any(p.exists() for p in possible_files)
         
         if not exists:
-            missing_files[normalized] += len(sources)
+            missing_files[normalized] += references
     
     # Categorize missing files
     categories = {
@@ -8,66 +8,46 @@ import os
 import re
 from pathlib import Path
 
+from _parallel import map_files
+
 # Base directories for the downloaded sites
 BASE_DIR = Path(__file__).parent
 
+# Downloaded site domains, each mirrored under BASE_DIR
+DOMAINS = ['ontariowildflowers.com', 'ontariotrees.com']
+
+
+# Absolute links into either site, rewritten in one pass over each file.
+# Matches href="http(s)://[www.]domain/..." (also the domain root without a
+# trailing slash), and the same for src= except that only the bare domain is
+# rewritten there, not the www. variant
+LINK_PATTERN = re.compile(
+    r'(?:(href)="https?://(?:www\.)?|(src)="https?://)'
+    rf'(?:{"|".join(re.escape(domain) for domain in DOMAINS)})(/|")'
+)
+
+
+def _relative_link(match):
+    """Replacement for LINK_PATTERN: keep the attribute, point at the parent dir."""
+    attr = match.group(1) or match.group(2)
+    return f'{attr}="../' + ('"' if match.group(3) == '"' else '')
+
+
 def convert_html_links(html_file):
     """Convert absolute URLs in HTML file to relative paths."""
     
-    # Domains and their local paths
-    domain_map = {
-        'ontariowildflowers.com': BASE_DIR / 'ontariowildflowers.com',
-        'ontariotrees.com': BASE_DIR / 'ontariotrees.com',
-    }
-    
     with open(html_file, 'r', encoding='utf-8', errors='ignore') as f:
         content = f.read()
-    
-    original_content = content
-    
-    # Convert href links
-    # Pattern matches: href="http://domain/path" or href="https://domain/path"
-    # Also handles links to domain root without trailing slash
-    for domain, local_path in domain_map.items():
-        # Convert http to https with path
-        content = re.sub(
-            rf'href="https?://{re.escape(domain)}/',
-            rf'href="../',
-            content
-        )
-        # Convert links to domain root (without trailing slash)
-        content = re.sub(
-            rf'href="https?://{re.escape(domain)}"',
-            rf'href="../"',
-            content
-        )
-        # Convert www. variant
-        content = re.sub(
-            rf'href="https?://www\.{re.escape(domain)}/',
-            rf'href="../',
-            content
-        )
-        content = re.sub(
-            rf'href="https?://www\.{re.escape(domain)}"',
-            rf'href="../"',
-            content
-        )
-    
-    # Convert src links (for images, scripts, etc.)
-    for domain, local_path in domain_map.items():
-        content = re.sub(
-            rf'src="https?://{re.escape(domain)}/',
-            r'src="../',
-            content
-        )
-        content = re.sub(
-            rf'src="https?://{re.escape(domain)}"',
-            r'src="../"',
-            content
-        )
+
+    # Most pages never mention either domain; a substring scan is far cheaper
+    # than running the pattern over them
+    if not any(domain in content for domain in DOMAINS):
+        return False
+
+    content, replaced = LINK_PATTERN.subn(_relative_link, content)
     
     # Write back if changed
-    if content != original_content:
+    if replaced:
         with open(html_file, 'w', encoding='utf-8') as f:
             f.write(content)
         return True
@@ -84,9 +64,12 @@ def main():
         if not site_path.exists():
             continue
             
-        for html_file in site_path.rglob('*.html'):
-            total_files += 1
-            if convert_html_links(html_file):
+        html_files = list(site_path.rglob('*.html'))
+        total_files += len(html_files)
+        results = map_files(convert_html_links, html_files, chunksize=64)
+
+        for html_file, converted in zip(html_files, results):
+            if converted:
                 converted_files += 1
                 print(f"Converted: {html_file.relative_to(BASE_DIR)}")
     
@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# The ontario_sites scripts are standalone and import their shared helpers
+# (such as _links) by bare name, as they do when run from that directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,7 @@
+from check_broken_links import extract_hrefs
+
+
+def test_extract_hrefs_returns_unescaped_hrefs_only():
+    """Test that only href values are returned, with entity references decoded."""
+    content = '<img src="leaf.jpg"><a href="species.php?id=1&amp;type=F"><script src="s.js"></script>'
+    assert extract_hrefs(content) == ["species.php?id=1&type=F"]
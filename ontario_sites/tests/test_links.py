@@ -0,0 +1,27 @@
+from _links import extract_links
+
+
+def test_href_and_src_on_one_tag():
+    """Test that a tag carrying both attributes reports href before src."""
+    assert extract_links('<a src="s.jpg" href="x.html">x</a>') == [('href', 'x.html'), ('src', 's.jpg')]
+
+
+def test_links_in_document_order():
+    """Test that links from different tags come back in the order they appear."""
+    content = '<link href="a.css"><img src="b.jpg"><a href="c.html">c</a><script src="d.js"></script>'
+    assert extract_links(content) == [
+        ('href', 'a.css'),
+        ('src', 'b.jpg'),
+        ('href', 'c.html'),
+        ('src', 'd.js'),
+    ]
+
+
+def test_values_are_unescaped():
+    """Test that entity references in attribute values are decoded."""
+    assert extract_links('<a href="species.php?id=1&amp;type=F">') == [('href', 'species.php?id=1&type=F')]
+
+
+def test_last_duplicate_wins():
+    """Test that a repeated attribute reports only its last value."""
+    assert extract_links('<a href="first.html" HREF="last.html">') == [('href', 'last.html')]
@@ -8,24 +8,20 @@ import os
 import re
 from pathlib import Path
 from collections import Counter
-from html.parser import HTMLParser
-from urllib.parse import urlparse
+from functools import lru_cache, partial
 
+from _links import extract_links, link_netloc, same_domain_hosts
+from _parallel import map_files
 
-class LinkExtractor(HTMLParser):
-    """Extract href and src attributes from HTML."""
-    
-    def __init__(self):
-        super().__init__()
-        self.href_links = []
-        self.src_links = []
-        
-    def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
-        if 'href' in attrs_dict:
-            self.href_links.append(attrs_dict['href'])
-        if 'src' in attrs_dict:
-            self.src_links.append(attrs_dict['src'])
+
+@lru_cache(maxsize=None)
+def _same_domain_prefixes(base_domain):
+    """URL prefixes whose netloc is always one of the same-domain hosts."""
+    return tuple(
+        f'{scheme}://{host}/'
+        for scheme in ('http', 'https')
+        for host in sorted(same_domain_hosts(base_domain))
+    )
 
 
 def classify_link(link, base_domain=None):
@@ -47,16 +43,42 @@ def classify_link(link, base_domain=None):
     if not link.startswith('http://') and not link.startswith('https://'):
         return 'relative'
     
-    # Parse the URL
-    parsed = urlparse(link)
+    if not base_domain:
+        return 'external'
+    
+    # Most same-domain links have a path, so a prefix check settles them
+    # without parsing
+    if link.startswith(_same_domain_prefixes(base_domain)):
+        return 'same_domain'
     
     # Check if it's the same domain
-    if base_domain and (parsed.netloc == base_domain or parsed.netloc == 'www.' + base_domain):
+    if link_netloc(link) in same_domain_hosts(base_domain):
         return 'same_domain'
     
     return 'external'
 
 
+def classify_file_links(html_file, site_name):
+    """
+    Classify the links of one HTML file, every href before every src.
+    
+    Returns:
+        Tuple of ([(link_type, link)], error or None)
+    """
+    try:
+        with open(html_file, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+        
+        links = extract_links(content)
+        return [
+            (classify_link(link, site_name), link)
+            for link in [v for a, v in links if a == 'href'] + [v for a, v in links if a == 'src']
+        ], None
+    
+    except Exception as e:
+        return [], str(e)
+
+
 def analyze_site_links(site_path, site_name, sample_size=20):
     """
     Analyze link types in HTML files for a single site.
@@ -82,31 +104,31 @@ def analyze_site_links(site_path, site_name, sample_size=20):
     
     # Counters for link classification
     link_types = Counter()
-    all_links = []
-    
-    for html_file in html_files:
-        try:
-            with open(html_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            parser = LinkExtractor()
-            parser.feed(content)
-            
-            # Process all extracted links
-            for link in parser.href_links + parser.src_links:
-                link_type = classify_link(link, site_name)
-                link_types[link_type] += 1
-                all_links.append((str(html_file.relative_to(site_path)), link_type, link))
-                
-        except Exception as e:
-            print(f"Error processing {html_file}: {e}")
+    sample_links = []   # First 50 links for review
+    
+    # Parse files in worker processes; results come back in html_files order
+    results = map_files(partial(classify_file_links, site_name=site_name), html_files)
+    
+    for html_file, (classified, error) in zip(html_files, results):
+        if error is not None:
+            print(f"Error processing {html_file}: {error}")
+            continue
+        link_types.update(link_type for link_type, link in classified)
+        
+        # Only the first 50 links are reported, so stop collecting once full
+        if len(sample_links) < 50:
+            source = str(html_file.relative_to(site_path))
+            sample_links.extend(
+                (source, link_type, link)
+                for link_type, link in classified[:50 - len(sample_links)]
+            )
     
     return {
         'site_name': site_name,
         'files_analyzed': len(html_files),
         'total_links': sum(link_types.values()),
         'link_types': link_types,
-        'sample_links': all_links[:50]  # First 50 links for review
+        'sample_links': sample_links,
     }
 
 
@@ -6,24 +6,65 @@ Ensures directory can be moved without breaking links.
 
 import os
 import re
+from functools import partial
 from pathlib import Path
-from html.parser import HTMLParser
-from urllib.parse import urlparse
 
+from _links import extract_links, link_netloc, same_domain_hosts
+from _parallel import map_files
 
-class LinkExtractor(HTMLParser):
-    """Extract href and src attributes from HTML."""
+
+def find_link_issues(html_file, site_name):
+    """
+    Classify the links of one HTML file by portability issue, in document order.
     
-    def __init__(self):
-        super().__init__()
-        self.links = []
+    Returns:
+        Tuple of ([(issue, attr_type, link)], error or None)
+    """
+    found = []
+    try:
+        with open(html_file, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
         
-    def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
-        if 'href' in attrs_dict:
-            self.links.append(('href', attrs_dict['href']))
-        if 'src' in attrs_dict:
-            self.links.append(('src', attrs_dict['src']))
+        for attr_type, link in extract_links(content):
+            link = link.strip()
+            
+            if not link:
+                continue
+            
+            # Skip fragment-only links
+            if link.startswith('#'):
+                found.append(('fragment_only', attr_type, link))
+                continue
+            
+            # Check for absolute file paths
+            if link.startswith('/') and not link.startswith('//'):
+                # Unix absolute path
+                if link.startswith('/Users/') or link.startswith('/home/') or link.startswith('/Users/'):
+                    found.append(('absolute_file_paths', attr_type, link))
+                    continue
+            
+            # Check for hardcoded home directory
+            if '/Users/margaretholen/' in link or '/home/margaretholen/' in link:
+                found.append(('hardcoded_home_dir', attr_type, link))
+                continue
+            
+            # Check for absolute http/https URLs (same domain)
+            if link.startswith('http://') or link.startswith('https://'):
+                if link_netloc(link) in same_domain_hosts(site_name):
+                    found.append(('absolute_http_urls', attr_type, link))
+                else:
+                    # External links are OK for portability
+                    pass
+                continue
+            
+            # Relative links are good
+            if not link.startswith('file://'):
+                found.append(('relative_links', attr_type, link))
+            
+        return found, None
+    
+    except Exception as e:
+        return [], str(e)
 
 
 def check_portability(site_path, site_name):
@@ -48,53 +89,16 @@ def check_portability(site_path, site_name):
         'fragment_only': [],
     }
     
-    for html_file in html_files:
-        try:
-            with open(html_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            parser = LinkExtractor()
-            parser.feed(content)
-            
-            for attr_type, link in parser.links:
-                link = link.strip()
-                
-                if not link:
-                    continue
-                
-                # Skip fragment-only links
-                if link.startswith('#'):
-                    issues['fragment_only'].append((str(html_file.relative_to(site_path)), attr_type, link))
-                    continue
-                
-                # Check for absolute file paths
-                if link.startswith('/') and not link.startswith('//'):
-                    # Unix absolute path
-                    if link.startswith('/Users/') or link.startswith('/home/') or link.startswith('/Users/'):
-                        issues['absolute_file_paths'].append((str(html_file.relative_to(site_path)), attr_type, link))
-                        continue
-                
-                # Check for hardcoded home directory
-                if '/Users/margaretholen/' in link or '/home/margaretholen/' in link:
-                    issues['hardcoded_home_dir'].append((str(html_file.relative_to(site_path)), attr_type, link))
-                    continue
-                
-                # Check for absolute http/https URLs (same domain)
-                if link.startswith('http://') or link.startswith('https://'):
-                    parsed = urlparse(link)
-                    if parsed.netloc == site_name or parsed.netloc == 'www.' + site_name:
-                        issues['absolute_http_urls'].append((str(html_file.relative_to(site_path)), attr_type, link))
-                    else:
-                        # External links are OK for portability
-                        pass
-                    continue
-                
-                # Relative links are good
-                if not link.startswith('file://'):
-                    issues['relative_links'].append((str(html_file.relative_to(site_path)), attr_type, link))
-                
-        except Exception as e:
-            print(f"Error processing {html_file}: {e}")
+    # Parse files in worker processes; results come back in html_files order
+    results = map_files(partial(find_link_issues, site_name=site_name), html_files)
+    
+    for html_file, (found, error) in zip(html_files, results):
+        if error is not None:
+            print(f"Error processing {html_file}: {error}")
+            continue
+        source = str(html_file.relative_to(site_path))
+        for issue, attr_type, link in found:
+            issues[issue].append((source, attr_type, link))
     
     return {
         'site_name': site_name,
@@ -208,12 +212,8 @@ def test_directory_move(site_path, temp_dir):
             with open(html_file, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read()
             
-            # Check if file can be read and parsed
-            parser = LinkExtractor()
-            parser.feed(content)
-            
             # Verify relative links point to existing files
-            for attr_type, link in parser.links:
+            for attr_type, link in extract_links(content):
                 link = link.strip()
                 if link and not link.startswith('#') and not link.startswith('http'):
                     # This is a relative link
@@ -4,6 +4,8 @@ import os
 import requests
 import time
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 def get_traits(html_content):
     soup = BeautifulSoup(html_content, 'html.parser')
@@ -34,6 +36,68 @@ def get_traits(html_content):
             
     return traits
 
+def export_species(species, output_path, i, total, session, failure_writer):
+    """
+    Fetch one species page (or its local copy) and save its traits to output_path.
+    
+    Returns:
+        True if the traits were saved
+    """
+    parts = species.split()
+    if len(parts) >= 2:
+        genus = parts[0].lower()
+        spec = parts[1].lower()
+    
+        url = f"https://gobotany.nativeplanttrust.org/species/{genus}/{spec}/"
+    
+        # Local file check (specifically for the provided example or others)
+        local_filename = f"{genus}{spec}.html"
+    
+        html_content = None
+        source = "web"
+    
+        if os.path.exists(local_filename):
+            print(f"[{i+1}/{total}] Processing {species} from local file...")
+            try:
+                with open(local_filename, 'r', encoding='utf-8') as f:
+                    html_content = f.read()
+                source = "local"
+            except Exception as e:
+                print(f"Error reading local file {local_filename}: {e}")
+    
+        if not html_content:
+            print(f"[{i+1}/{total}] Fetching {species} from {url}...")
+            try:
+                response = session.get(url, timeout=30)
+                if response.status_code == 200:
+                    html_content = response.text
+                    time.sleep(1) # Be polite
+                else:
+                    print(f"Failed to fetch {url}: {response.status_code}")
+                    failure_writer.writerow([species, url, f"HTTP {response.status_code}"])
+                    return False
+            except Exception as e:
+                print(f"Error fetching {url}: {e}")
+                failure_writer.writerow([species, url, str(e)])
+                return False
+
+        # Extract and Save
+        if html_content:
+            try:
+                traits = get_traits(html_content)
+                traits['scientific_name'] = species
+                traits['url'] = url
+                traits['source'] = source
+            
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(traits, f, indent=2)
+                # print(f"Saved {output_path}")
+                return True
+            except Exception as e:
+                print(f"Error parsing/saving {species}: {e}")
+                failure_writer.writerow([species, url, f"Parse/Save Error: {str(e)}"])
+    return False
+
 def main():
     observations_file = 'data/observations.csv'
     traits_dir = 'data/traits'
@@ -52,86 +116,48 @@ def main():
     unique_species = set()
     try:
         with open(observations_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                scientific_name = row.get('scientific_name')
-                if scientific_name:
-                    unique_species.add(scientific_name)
+            # Only one column is needed, so read it by position rather than
+            # building a dict for every row
+            reader = csv.reader(f)
+            header = next(reader, [])
+            if 'scientific_name' in header:
+                column = header.index('scientific_name')
+                unique_species = {row[column] for row in reader if len(row) > column and row[column]}
     except FileNotFoundError:
         print(f"Error: {observations_file} not found.")
         return
 
     print(f"Found {len(unique_species)} unique species.")
     
-    # 2. Process each species
-    for i, species in enumerate(unique_species):
-        # Generate filename
-        safe_name = species.replace(' ', '_').replace('/', '-')
-        output_path = os.path.join(traits_dir, f"{safe_name}.json")
-        
-        # Skip if already exists
-        if os.path.exists(output_path):
-            # print(f"Skipping {species} (already exists)")
-            continue
+    # One keep-alive connection for every fetch instead of a new TCP/TLS
+    # handshake per species. Transient failures are retried with backoff; the
+    # final response is still returned so its status is logged as before
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=1, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False)
+    session.mount('https://', HTTPAdapter(max_retries=retries))
+    
+    # Failures are appended through one writer held open for the whole run
+    with open(failures_file, 'a', newline='', encoding='utf-8') as failures:
+        failure_writer = csv.writer(failures)
 
-        parts = species.split()
-        if len(parts) >= 2:
-            genus = parts[0].lower()
-            spec = parts[1].lower()
-            
-            url = f"https://gobotany.nativeplanttrust.org/species/{genus}/{spec}/"
-            
-            # Local file check (specifically for the provided example or others)
-            local_filename = f"{genus}{spec}.html"
-            
-            html_content = None
-            source = "web"
-            
-            if os.path.exists(local_filename):
-                print(f"[{i+1}/{len(unique_species)}] Processing {species} from local file...")
-                try:
-                    with open(local_filename, 'r', encoding='utf-8') as f:
-                        html_content = f.read()
-                    source = "local"
-                except Exception as e:
-                    print(f"Error reading local file {local_filename}: {e}")
-            
-            if not html_content:
-                print(f"[{i+1}/{len(unique_species)}] Fetching {species} from {url}...")
-                try:
-                    response = requests.get(url)
-                    if response.status_code == 200:
-                        html_content = response.text
-                        time.sleep(1) # Be polite
-                    else:
-                        print(f"Failed to fetch {url}: {response.status_code}")
-                        with open(failures_file, 'a', newline='', encoding='utf-8') as f:
-                            writer = csv.writer(f)
-                            writer.writerow([species, url, f"HTTP {response.status_code}"])
-                        continue
-                except Exception as e:
-                    print(f"Error fetching {url}: {e}")
-                    with open(failures_file, 'a', newline='', encoding='utf-8') as f:
-                        writer = csv.writer(f)
-                        writer.writerow([species, url, str(e)])
-                    continue
+        # Species exported by earlier runs, from one directory listing
+        exported = {name[:-len('.json')] for name in os.listdir(traits_dir) if name.endswith('.json')}
+
+        # 2. Process each species
+        for i, species in enumerate(unique_species):
+            # Generate filename
+            safe_name = species.replace(' ', '_').replace('/', '-')
+            output_path = os.path.join(traits_dir, f"{safe_name}.json")
+        
+            # Skip if already exists
+            if safe_name in exported:
+                # print(f"Skipping {species} (already exists)")
+                continue
 
-            # Extract and Save
-            if html_content:
-                try:
-                    traits = get_traits(html_content)
-                    traits['scientific_name'] = species
-                    traits['url'] = url
-                    traits['source'] = source
-                    
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        json.dump(traits, f, indent=2)
-                    # print(f"Saved {output_path}")
-                except Exception as e:
-                    print(f"Error parsing/saving {species}: {e}")
-                    with open(failures_file, 'a', newline='', encoding='utf-8') as f:
-                        writer = csv.writer(f)
-                        writer.writerow([species, url, f"Parse/Save Error: {str(e)}"])
+            # Names that differ only in ' ' vs '_' or '/' vs '-' share a file,
+            # so record it to skip the later ones as a pre-existing file would
+            if export_species(species, output_path, i, len(unique_species), session, failure_writer):
+                exported.add(safe_name)
 
 if __name__ == "__main__":
     main()